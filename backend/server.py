@@ -1,4 +1,4 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Header, Query, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
@@ -6,14 +6,16 @@ from motor.motor_asyncio import AsyncIOMotorClient
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, model_validator
+from typing import List, Optional, Dict, Any, Literal
 import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
 import bcrypt
 import jwt
 import random
-from collections import defaultdict
+import re
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -59,8 +61,8 @@ class InventoryBatchCreate(BaseModel):
     quantity: int
     unit: str
     source: str
-    received_date: str
-    expiration_date: str
+    received_date: date
+    expiration_date: date
     storage_location: str
 
 class InventoryBatch(BaseModel):
@@ -74,8 +76,46 @@ class InventoryBatch(BaseModel):
     received_date: str
     expiration_date: str
     storage_location: str
+    version: int = 0
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+class PartialUpdate(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    @model_validator(mode="after")
+    def check_fields(self):
+        # Every stored field is required, so an explicit null would corrupt the document
+        if not self.model_fields_set:
+            raise ValueError("At least one field must be provided")
+        nulls = sorted(field for field in self.model_fields_set if getattr(self, field) is None)
+        if nulls:
+            raise ValueError(f"Fields cannot be null: {', '.join(nulls)}")
+        return self
+
+class InventoryBatchUpdate(PartialUpdate):
+    item_name: Optional[str] = None
+    category: Optional[str] = None
+    quantity: Optional[int] = Field(None, ge=0)
+    unit: Optional[str] = None
+    source: Optional[str] = None
+    received_date: Optional[date] = None
+    expiration_date: Optional[date] = None
+    storage_location: Optional[str] = None
+
+class InventoryAdjustment(BaseModel):
+    delta: int
+
+class InventorySummary(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    item_name: str
+    category: str
+    storage_location: str
+    total_quantity: int
+    unit: str
+    batch_count: int
+    nearest_expiration: Optional[str] = None
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
 class DistributionCreate(BaseModel):
     date: str
     location_id: str
@@ -96,7 +136,7 @@ class Distribution(BaseModel):
 class FoodRequestCreate(BaseModel):
     location_id: str
     items: List[Dict[str, Any]]
-    pickup_date: str
+    pickup_date: date
     pickup_time: str
     household_size: int
 
@@ -110,8 +150,21 @@ class FoodRequest(BaseModel):
     pickup_time: str
     household_size: int
     status: str = "pending"
+    version: int = 0
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+class FoodRequestItem(BaseModel):
+    name: str
+    quantity: int = Field(ge=1)
+
+class FoodRequestUpdate(PartialUpdate):
+    location_id: Optional[str] = None
+    items: Optional[List[FoodRequestItem]] = None
+    pickup_date: Optional[date] = None
+    pickup_time: Optional[str] = None
+    household_size: Optional[int] = Field(None, ge=1)
+    status: Optional[Literal["pending", "completed", "cancelled"]] = None
+
 class AlertCreate(BaseModel):
     alert_type: str
     message: str
@@ -158,6 +211,180 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     except Exception as e:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+# ============= Concurrency Functions =============
+
+def parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    if if_match is None or if_match.strip() == "*":
+        return None
+    tag = if_match.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    try:
+        return int(tag.strip('"'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="If-Match must be a version ETag")
+
+def versioned_filter(doc_id: str, expected_version: Optional[int]) -> Dict[str, Any]:
+    query: Dict[str, Any] = {"id": doc_id}
+    if expected_version is not None:
+        # Documents written before versioning have no field and count as version 0
+        query["version"] = {"$in": [0, None]} if expected_version == 0 else expected_version
+    return query
+
+def versioned_update(updates: Dict[str, Any]) -> Dict[str, Any]:
+    return {"$set": updates, "$inc": {"version": 1}}
+
+def set_etag(response: Response, version: int):
+    response.headers["ETag"] = f'"{version}"'
+
+# ============= Search Functions =============
+
+class ItemNamePrefixIndex:
+    """Sorted, case-insensitive index of inventory item names for typeahead lookups.
+
+    A name matches a prefix when the whole name or any word in it starts with the
+    prefix, so "rice" finds both "Rice Flour" and "Brown Rice", and "brow" finds
+    "Brown Rice". Each name is counted once per active stock summary that carries
+    it and stays indexed until the last of those is discarded.
+    """
+
+    def __init__(self):
+        self._entries: List[tuple] = []
+        self._tokens: Dict[str, set] = {}
+        self._counts: Dict[str, int] = {}
+
+    @staticmethod
+    def _tokenize(name: str) -> set:
+        lowered = name.lower()
+        return {lowered, *re.findall(r"\w+", lowered)}
+
+    def rebuild(self, names):
+        self._counts = dict(Counter(names))
+        self._tokens = {name: self._tokenize(name) for name in self._counts}
+        self._entries = sorted((token, name) for name, tokens in self._tokens.items() for token in tokens)
+
+    def add(self, name: str):
+        self._counts[name] = self._counts.get(name, 0) + 1
+        if name in self._tokens:
+            return
+        self._tokens[name] = self._tokenize(name)
+        for token in self._tokens[name]:
+            insort(self._entries, (token, name))
+
+    def discard(self, name: str):
+        if name not in self._counts:
+            return
+        self._counts[name] -= 1
+        if self._counts[name] > 0:
+            return
+        del self._counts[name]
+        for token in self._tokens.pop(name):
+            self._entries.pop(bisect_left(self._entries, (token, name)))
+
+    def search(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        matches = set()
+        for token, name in self._entries[bisect_left(self._entries, (prefix,)):]:
+            if not token.startswith(prefix):
+                break
+            matches.add(name)
+        # Names that start with the prefix rank ahead of mid-name word matches
+        ranked = sorted(matches, key=lambda name: (not name.lower().startswith(prefix), name.lower(), name))
+        return ranked[:limit] if limit is not None else ranked
+
+item_name_index = ItemNamePrefixIndex()
+SEARCH_NAME_CHUNK = 100
+
+def date_range_filter(date_from: Optional[date], date_to: Optional[date]) -> Optional[Dict[str, str]]:
+    # Dates are stored as zero-padded YYYY-MM-DD strings, so lexical comparison is chronological
+    bounds = {}
+    if date_from:
+        bounds["$gte"] = date_from.isoformat()
+    if date_to:
+        bounds["$lte"] = date_to.isoformat()
+    return bounds or None
+
+# ============= Stock Summary Functions =============
+
+LOW_STOCK_THRESHOLD = 50
+# Unit is part of the key so batches counted in different units are never summed together
+SUMMARY_KEY_FIELDS = ("item_name", "category", "storage_location", "unit")
+# Summaries whose batches are all gone stay behind as zero-count tombstones holding the refresh sequence
+ACTIVE_SUMMARY = {"batch_count": {"$gt": 0}}
+
+def summary_key(batch: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: batch[field] for field in SUMMARY_KEY_FIELDS}
+
+async def refresh_stock_summary(key: Dict[str, Any]):
+    # Take a per-key sequence number *after* the batch write, then recompute from the batches.
+    # A refresh only lands if no later-sequenced refresh has, and any later refresh aggregated
+    # at least every write this one saw, so concurrent refreshes can't leave stale totals behind.
+    marker = await db.inventory_summaries.find_one_and_update(
+        key,
+        {"$inc": {"refresh_seq": 1}},
+        upsert=True,
+        return_document=True,
+        projection={"_id": 0, "refresh_seq": 1}
+    )
+    seq = marker["refresh_seq"]
+
+    pipeline = [
+        {"$match": key},
+        {"$group": {
+            "_id": None,
+            "total_quantity": {"$sum": "$quantity"},
+            "batch_count": {"$sum": 1},
+            "nearest_expiration": {"$min": "$expiration_date"}
+        }}
+    ]
+    totals = await db.inventory_batches.aggregate(pipeline).to_list(1)
+    totals = totals[0] if totals else {"total_quantity": 0, "batch_count": 0}
+    totals.pop("_id", None)
+
+    doc = InventorySummary(**key, **totals).model_dump()
+    doc['updated_at'] = doc['updated_at'].isoformat()
+    doc['applied_seq'] = seq
+    previous = await db.inventory_summaries.find_one_and_update(
+        {**key, "$or": [{"applied_seq": {"$lt": seq}}, {"applied_seq": {"$exists": False}}]},
+        {"$set": doc},
+        projection={"_id": 0, "batch_count": 1}
+    )
+    if previous is None:
+        return
+
+    # Only the refresh that flips a key between active and empty touches the name index,
+    # with no await in between, so the index counts exactly the active summaries per name
+    was_active = previous.get("batch_count", 0) > 0
+    if doc['batch_count'] > 0 and not was_active:
+        item_name_index.add(key["item_name"])
+    elif was_active and doc['batch_count'] == 0:
+        item_name_index.discard(key["item_name"])
+
+async def rebuild_stock_summaries():
+    pipeline = [
+        {"$group": {
+            "_id": {field: f"${field}" for field in SUMMARY_KEY_FIELDS},
+            "total_quantity": {"$sum": "$quantity"},
+            "batch_count": {"$sum": 1},
+            "nearest_expiration": {"$min": "$expiration_date"}
+        }}
+    ]
+    groups = await db.inventory_batches.aggregate(pipeline).to_list(None)
+    docs = []
+    for group in groups:
+        key = group.pop("_id")
+        doc = InventorySummary(**key, **group).model_dump()
+        doc['updated_at'] = doc['updated_at'].isoformat()
+        doc['refresh_seq'] = doc['applied_seq'] = 0
+        docs.append(doc)
+
+    await db.inventory_summaries.delete_many({})
+    if docs:
+        await db.inventory_summaries.insert_many(docs)
+    item_name_index.rebuild(doc["item_name"] for doc in docs)
+
 # ============= Auth Routes =============
 
 @api_router.post("/auth/register", response_model=User)
@@ -195,11 +422,12 @@ async def get_me(current_user: User = Depends(get_current_user)):
 
 @api_router.post("/inventory", response_model=InventoryBatch)
 async def create_inventory_batch(batch: InventoryBatchCreate, current_user: User = Depends(get_current_user)):
-    inventory_batch = InventoryBatch(**batch.model_dump())
+    inventory_batch = InventoryBatch(**batch.model_dump(mode="json"))
     doc = inventory_batch.model_dump()
     doc['created_at'] = doc['created_at'].isoformat()
     
     await db.inventory_batches.insert_one(doc)
+    await refresh_stock_summary(summary_key(doc))
     return inventory_batch
 
 @api_router.get("/inventory", response_model=List[InventoryBatch])
@@ -210,25 +438,122 @@ async def get_inventory():
             batch['created_at'] = datetime.fromisoformat(batch['created_at'])
     return batches
 
+@api_router.get("/inventory/summary", response_model=List[InventorySummary])
+async def get_inventory_summary(low_stock: bool = False):
+    query = dict(ACTIVE_SUMMARY)
+    if low_stock:
+        query["total_quantity"] = {"$lt": LOW_STOCK_THRESHOLD}
+    summaries = await db.inventory_summaries.find(query, {"_id": 0}).sort("item_name", 1).to_list(1000)
+    for summary in summaries:
+        if isinstance(summary.get('updated_at'), str):
+            summary['updated_at'] = datetime.fromisoformat(summary['updated_at'])
+    return summaries
+
+@api_router.get("/inventory/typeahead", response_model=List[str])
+async def get_inventory_typeahead(q: str = Query(..., min_length=1), limit: int = Query(10, ge=1, le=50)):
+    return item_name_index.search(q, limit)
+
+@api_router.get("/inventory/search", response_model=List[InventoryBatch])
+async def search_inventory(
+    q: Optional[str] = None,
+    category: Optional[str] = None,
+    source: Optional[str] = None,
+    storage_location: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    limit: int = Query(100, ge=1, le=1000)
+):
+    query: Dict[str, Any] = {}
+    if category:
+        query["category"] = category
+    if source:
+        query["source"] = source
+    if storage_location:
+        query["storage_location"] = storage_location
+    received_range = date_range_filter(date_from, date_to)
+    if received_range:
+        query["received_date"] = received_range
+
+    if q:
+        # Walk the matching names in item_name (codepoint) order, a bounded $in at a time,
+        # until enough batches are found, so a short prefix never builds one huge $in
+        names = sorted(item_name_index.search(q))
+        batches = []
+        for start in range(0, len(names), SEARCH_NAME_CHUNK):
+            chunk_query = {**query, "item_name": {"$in": names[start:start + SEARCH_NAME_CHUNK]}}
+            batches += await db.inventory_batches.find(chunk_query, {"_id": 0}).sort("item_name", 1).to_list(limit - len(batches))
+            if len(batches) >= limit:
+                break
+    else:
+        batches = await db.inventory_batches.find(query, {"_id": 0}).sort("item_name", 1).to_list(limit)
+    for batch in batches:
+        if isinstance(batch.get('created_at'), str):
+            batch['created_at'] = datetime.fromisoformat(batch['created_at'])
+    return batches
+
 @api_router.put("/inventory/{batch_id}", response_model=InventoryBatch)
-async def update_inventory_batch(batch_id: str, updates: Dict[str, Any], current_user: User = Depends(get_current_user)):
+async def update_inventory_batch(
+    batch_id: str,
+    payload: InventoryBatchUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user)
+):
+    updates = payload.model_dump(exclude_unset=True, mode="json")
+    previous = await db.inventory_batches.find_one_and_update(
+        versioned_filter(batch_id, parse_if_match(if_match)),
+        versioned_update(updates),
+        return_document=False,
+        projection={"_id": 0}
+    )
+    if not previous:
+        if await db.inventory_batches.find_one({"id": batch_id}, {"_id": 1}):
+            raise HTTPException(status_code=412, detail="Batch was modified by another user")
+        raise HTTPException(status_code=404, detail="Batch not found")
+    result = {**previous, **updates, "version": previous.get("version", 0) + 1}
+
+    await refresh_stock_summary(summary_key(previous))
+    if summary_key(result) != summary_key(previous):
+        await refresh_stock_summary(summary_key(result))
+    if isinstance(result.get('created_at'), str):
+        result['created_at'] = datetime.fromisoformat(result['created_at'])
+    set_etag(response, result['version'])
+    return InventoryBatch(**result)
+
+@api_router.post("/inventory/{batch_id}/adjust", response_model=InventoryBatch)
+async def adjust_inventory_batch(
+    batch_id: str,
+    adjustment: InventoryAdjustment,
+    response: Response,
+    current_user: User = Depends(get_current_user)
+):
+    # Atomic $inc, so concurrent adjustments never lose updates and need no If-Match
+    query: Dict[str, Any] = {"id": batch_id}
+    if adjustment.delta < 0:
+        query["quantity"] = {"$gte": -adjustment.delta}
     result = await db.inventory_batches.find_one_and_update(
-        {"id": batch_id},
-        {"$set": updates},
+        query,
+        {"$inc": {"quantity": adjustment.delta, "version": 1}},
         return_document=True,
         projection={"_id": 0}
     )
     if not result:
+        if await db.inventory_batches.find_one({"id": batch_id}, {"_id": 1}):
+            raise HTTPException(status_code=409, detail="Insufficient quantity in batch")
         raise HTTPException(status_code=404, detail="Batch not found")
+
+    await refresh_stock_summary(summary_key(result))
     if isinstance(result.get('created_at'), str):
         result['created_at'] = datetime.fromisoformat(result['created_at'])
+    set_etag(response, result['version'])
     return InventoryBatch(**result)
 
 @api_router.delete("/inventory/{batch_id}")
 async def delete_inventory_batch(batch_id: str, current_user: User = Depends(get_current_user)):
-    result = await db.inventory_batches.delete_one({"id": batch_id})
-    if result.deleted_count == 0:
+    deleted = await db.inventory_batches.find_one_and_delete({"id": batch_id}, projection={"_id": 0})
+    if not deleted:
         raise HTTPException(status_code=404, detail="Batch not found")
+    await refresh_stock_summary(summary_key(deleted))
     return {"message": "Batch deleted successfully"}
 
 # ============= Distribution Routes =============
@@ -254,7 +579,7 @@ async def get_distributions(current_user: User = Depends(get_current_user)):
 
 @api_router.post("/requests", response_model=FoodRequest)
 async def create_food_request(request: FoodRequestCreate):
-    food_request = FoodRequest(**request.model_dump())
+    food_request = FoodRequest(**request.model_dump(mode="json"))
     doc = food_request.model_dump()
     doc['created_at'] = doc['created_at'].isoformat()
     
@@ -269,18 +594,72 @@ async def get_food_requests(current_user: User = Depends(get_current_user)):
             req['created_at'] = datetime.fromisoformat(req['created_at'])
     return requests
 
+@api_router.get("/requests/search", response_model=List[FoodRequest])
+async def search_food_requests(
+    q: Optional[str] = None,
+    status: Optional[str] = None,
+    location_id: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: User = Depends(get_current_user)
+):
+    query: Dict[str, Any] = {}
+    if status:
+        query["status"] = status
+    if location_id:
+        query["location_id"] = location_id
+    pickup_range = date_range_filter(date_from, date_to)
+    if pickup_range:
+        query["pickup_date"] = pickup_range
+
+    confirmation = (q or "").strip().upper()
+    if confirmation.startswith("TS-") or confirmation.isdigit():
+        if not confirmation.startswith("TS-"):
+            confirmation = f"TS-{confirmation}"
+        # Anchored, case-sensitive prefix so the confirmation_number index is used
+        query["confirmation_number"] = {"$regex": f"^{re.escape(confirmation)}"}
+        requests = await db.food_requests.find(query, {"_id": 0}).sort("created_at", -1).to_list(limit)
+    elif q:
+        # Same item-name prefix matching as inventory search, a bounded $in at a time on the
+        # items.name multikey index; each chunk returns its newest `limit`, merged by recency
+        names = item_name_index.search(q)
+        found: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(names), SEARCH_NAME_CHUNK):
+            chunk_query = {**query, "items.name": {"$in": names[start:start + SEARCH_NAME_CHUNK]}}
+            for req in await db.food_requests.find(chunk_query, {"_id": 0}).sort("created_at", -1).to_list(limit):
+                found[req['id']] = req
+        requests = sorted(found.values(), key=lambda req: req['created_at'], reverse=True)[:limit]
+    else:
+        requests = await db.food_requests.find(query, {"_id": 0}).sort("created_at", -1).to_list(limit)
+
+    for req in requests:
+        if isinstance(req.get('created_at'), str):
+            req['created_at'] = datetime.fromisoformat(req['created_at'])
+    return requests
+
 @api_router.put("/requests/{request_id}", response_model=FoodRequest)
-async def update_food_request(request_id: str, updates: Dict[str, Any], current_user: User = Depends(get_current_user)):
+async def update_food_request(
+    request_id: str,
+    payload: FoodRequestUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user)
+):
+    updates = payload.model_dump(exclude_unset=True, mode="json")
     result = await db.food_requests.find_one_and_update(
-        {"id": request_id},
-        {"$set": updates},
+        versioned_filter(request_id, parse_if_match(if_match)),
+        versioned_update(updates),
         return_document=True,
         projection={"_id": 0}
     )
     if not result:
+        if await db.food_requests.find_one({"id": request_id}, {"_id": 1}):
+            raise HTTPException(status_code=412, detail="Request was modified by another user")
         raise HTTPException(status_code=404, detail="Request not found")
     if isinstance(result.get('created_at'), str):
         result['created_at'] = datetime.fromisoformat(result['created_at'])
+    set_etag(response, result['version'])
     return FoodRequest(**result)
 
 # ============= Alert Routes =============
@@ -325,31 +704,33 @@ async def get_dashboard_stats(current_user: User = Depends(get_current_user)):
     
     batches = await db.inventory_batches.find({}, {"_id": 0}).to_list(1000)
     
+    low_stock_summaries = await db.inventory_summaries.find(
+        {"total_quantity": {"$lt": LOW_STOCK_THRESHOLD}, **ACTIVE_SUMMARY}, {"_id": 0}
+    ).to_list(1000)
+    
     expiring_soon = 0
-    low_stock = 0
-    LOW_STOCK_THRESHOLD = 50
+    low_stock = len(low_stock_summaries)
     
     # Auto-generate alerts
     now = datetime.now()
     existing_alerts = await db.alerts.find({"resolved": False}, {"_id": 0, "message": 1}).to_list(1000)
     existing_messages = {alert['message'] for alert in existing_alerts}
     
+    # Check low stock against per-item totals across batches
+    for summary in low_stock_summaries:
+        alert_msg = f"Low stock: {summary['item_name']} has only {summary['total_quantity']} {summary['unit']} remaining at {summary['storage_location']}"
+        if alert_msg not in existing_messages:
+            await db.alerts.insert_one({
+                "id": str(uuid.uuid4()),
+                "alert_type": "Low Stock Alert",
+                "message": alert_msg,
+                "severity": "medium",
+                "metadata": summary_key(summary),
+                "resolved": False,
+                "created_at": now.isoformat()
+            })
+    
     for batch in batches:
-        # Check low stock
-        if batch['quantity'] < LOW_STOCK_THRESHOLD:
-            low_stock += 1
-            alert_msg = f"Low stock: {batch['item_name']} has only {batch['quantity']} {batch['unit']} remaining"
-            if alert_msg not in existing_messages:
-                await db.alerts.insert_one({
-                    "id": str(uuid.uuid4()),
-                    "alert_type": "Low Stock Alert",
-                    "message": alert_msg,
-                    "severity": "medium",
-                    "metadata": {"batch_id": batch['id'], "item_name": batch['item_name']},
-                    "resolved": False,
-                    "created_at": now.isoformat()
-                })
-        
         # Check expiration
         try:
             exp_date = datetime.strptime(batch['expiration_date'], "%Y-%m-%d")
@@ -559,6 +940,7 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 logging.basicConfig(
@@ -567,6 +949,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def init_stock_summaries():
+    await db.inventory_batches.create_index([(field, 1) for field in SUMMARY_KEY_FIELDS])
+    await db.inventory_summaries.create_index([(field, 1) for field in SUMMARY_KEY_FIELDS], unique=True)
+    await db.inventory_summaries.create_index("total_quantity")
+    # Batches may be loaded directly (e.g. scripts/seed_data.py), so rebuild from source
+    await rebuild_stock_summaries()
+
+@app.on_event("startup")
+async def init_search_indexes():
+    await db.inventory_batches.create_index([("category", 1), ("received_date", 1)])
+    await db.inventory_batches.create_index([("source", 1), ("received_date", 1)])
+    await db.inventory_batches.create_index("received_date")
+    await db.food_requests.create_index("items.name")
+    await db.food_requests.create_index([("status", 1), ("pickup_date", 1)])
+    await db.food_requests.create_index([("location_id", 1), ("pickup_date", 1)])
+    await db.food_requests.create_index("confirmation_number")
+    await db.food_requests.create_index("created_at")
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
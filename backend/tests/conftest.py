@@ -0,0 +1,9 @@
+import os
+import sys
+from pathlib import Path
+
+# server.py reads these at import time; the client connects lazily, so no database is needed
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'eightlife_test')
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,175 @@
+"""In-memory stand-ins for the parts of motor that server.py uses."""
+import asyncio
+import re
+from types import SimpleNamespace
+
+MISSING = object()
+
+
+def _values(doc, path):
+    # Resolve a dotted path, fanning out over arrays like Mongo does for multikey fields
+    values = [doc]
+    for part in path.split("."):
+        resolved = []
+        for value in values:
+            if isinstance(value, list):
+                resolved += [item.get(part, MISSING) for item in value if isinstance(item, dict)]
+            elif isinstance(value, dict):
+                resolved.append(value.get(part, MISSING))
+        values = resolved
+    return values or [MISSING]
+
+
+def _compare(value, op, operand):
+    if op == "$exists":
+        return (value is not MISSING) == operand
+    if op == "$in":
+        return (None if value is MISSING else value) in operand
+    if op == "$regex":
+        return isinstance(value, str) and re.search(operand, value) is not None
+    if value is MISSING or value is None:
+        return False
+    return {
+        "$gt": lambda: value > operand,
+        "$gte": lambda: value >= operand,
+        "$lt": lambda: value < operand,
+        "$lte": lambda: value <= operand,
+    }[op]()
+
+
+def matches(doc, query):
+    for field, expected in query.items():
+        if field == "$or":
+            if not any(matches(doc, clause) for clause in expected):
+                return False
+            continue
+        values = _values(doc, field)
+        if isinstance(expected, dict) and all(key.startswith("$") for key in expected):
+            if not any(all(_compare(value, op, operand) for op, operand in expected.items()) for value in values):
+                return False
+        elif expected not in values:
+            return False
+    return True
+
+
+def project(doc, projection):
+    if not projection:
+        return dict(doc)
+    included = [field for field, flag in projection.items() if flag and field != "_id"]
+    if included:
+        return {field: doc[field] for field in included if field in doc}
+    return {field: value for field, value in doc.items() if projection.get(field, 1)}
+
+
+def apply_update(doc, update):
+    doc.update(update.get("$set", {}))
+    for field, delta in update.get("$inc", {}).items():
+        doc[field] = doc.get(field, 0) + delta
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, field, direction=1):
+        self.docs.sort(key=lambda doc: doc.get(field), reverse=direction == -1)
+        return self
+
+    async def to_list(self, length):
+        await asyncio.sleep(0)
+        return self.docs if length is None else self.docs[:length]
+
+
+class FakeCollection:
+    def __init__(self, docs=()):
+        self.docs = [dict(doc) for doc in docs]
+
+    def _first(self, query):
+        return next((doc for doc in self.docs if matches(doc, query)), None)
+
+    def find(self, query=None, projection=None):
+        return FakeCursor([project(doc, projection) for doc in self.docs if matches(doc, query or {})])
+
+    async def find_one(self, query, projection=None):
+        doc = self._first(query)
+        return project(doc, projection) if doc else None
+
+    async def count_documents(self, query):
+        return sum(1 for doc in self.docs if matches(doc, query))
+
+    async def insert_one(self, doc):
+        self.docs.append(dict(doc))
+
+    async def insert_many(self, docs):
+        self.docs += [dict(doc) for doc in docs]
+
+    async def delete_many(self, query):
+        self.docs = [doc for doc in self.docs if not matches(doc, query)]
+
+    async def find_one_and_delete(self, query, projection=None):
+        doc = self._first(query)
+        if doc is None:
+            return None
+        self.docs.remove(doc)
+        return project(doc, projection)
+
+    async def find_one_and_update(self, query, update, upsert=False, return_document=False, projection=None):
+        doc = self._first(query)
+        before = None
+        if doc is None:
+            if not upsert:
+                return None
+            doc = {field: value for field, value in query.items() if not field.startswith("$") and not isinstance(value, dict)}
+            self.docs.append(doc)
+        else:
+            before = dict(doc)
+        apply_update(doc, update)
+        result = doc if return_document else before
+        return project(result, projection) if result is not None else None
+
+    async def update_one(self, query, update, upsert=False):
+        doc = self._first(query)
+        if doc is not None:
+            apply_update(doc, update)
+        return SimpleNamespace(matched_count=int(doc is not None))
+
+    def aggregate(self, pipeline):
+        docs = [dict(doc) for doc in self.docs]
+        for stage in pipeline:
+            if "$match" in stage:
+                docs = [doc for doc in docs if matches(doc, stage["$match"])]
+            elif "$group" in stage:
+                docs = self._group(docs, stage["$group"])
+        return FakeCursor(docs)
+
+    @staticmethod
+    def _group(docs, spec):
+        def field(ref):
+            return ref[1:] if isinstance(ref, str) and ref.startswith("$") else None
+
+        groups = {}
+        for doc in docs:
+            group_id = spec["_id"]
+            if isinstance(group_id, dict):
+                group_id = {name: doc.get(field(ref)) for name, ref in group_id.items()}
+            groups.setdefault(repr(group_id), (group_id, []))[1].append(doc)
+
+        results = []
+        for group_id, members in groups.values():
+            result = {"_id": group_id}
+            for name, accumulator in spec.items():
+                if name == "_id":
+                    continue
+                (op, ref), = accumulator.items()
+                values = [doc.get(field(ref)) for doc in members] if field(ref) else [ref] * len(members)
+                result[name] = {"$sum": sum, "$min": min, "$max": max, "$first": lambda v: v[0]}[op](values)
+            results.append(result)
+        return results
+
+
+class FakeDb:
+    def __init__(self, **collections):
+        self._collections = {name: FakeCollection(docs) for name, docs in collections.items()}
+
+    def __getattr__(self, name):
+        return self._collections.setdefault(name, FakeCollection())
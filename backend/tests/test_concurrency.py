@@ -0,0 +1,190 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException, Response
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+import server
+from server import (
+    FoodRequestUpdate,
+    InventoryAdjustment,
+    InventoryBatchUpdate,
+    parse_if_match,
+    versioned_filter,
+)
+from tests.fakes import FakeDb
+
+
+BATCH = {
+    "id": "inv-001",
+    "item_name": "Rice",
+    "category": "Dry",
+    "quantity": 100,
+    "unit": "lbs",
+    "source": "USDA",
+    "received_date": "2026-01-12",
+    "expiration_date": "2027-06-12",
+    "storage_location": "Warehouse A-2",
+    "created_at": "2026-01-12T10:00:00+00:00",
+}
+
+REQUEST = {
+    "id": "req-001",
+    "confirmation_number": "TS-123456",
+    "location_id": "LOC-001",
+    "items": [{"name": "Rice", "quantity": 1}],
+    "pickup_date": "2026-02-01",
+    "pickup_time": "10:00",
+    "household_size": 3,
+    "status": "pending",
+    "created_at": "2026-01-20T10:00:00+00:00",
+}
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    db = FakeDb(inventory_batches=[BATCH], food_requests=[REQUEST])
+    monkeypatch.setattr(server, "db", db)
+
+    async def no_refresh(key):
+        pass
+
+    monkeypatch.setattr(server, "refresh_stock_summary", no_refresh)
+    return db
+
+
+def status_of(coro):
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(coro)
+    return exc.value.status_code
+
+
+@pytest.mark.parametrize("header, expected", [('"3"', 3), ('W/"3"', 3), ("3", 3), ("*", None), (None, None)])
+def test_parse_if_match(header, expected):
+    assert parse_if_match(header) == expected
+
+
+def test_parse_if_match_rejects_malformed_tag():
+    with pytest.raises(HTTPException) as exc:
+        parse_if_match('"abc"')
+    assert exc.value.status_code == 400
+
+
+def test_versioned_filter():
+    assert versioned_filter("inv-001", None) == {"id": "inv-001"}
+    assert versioned_filter("inv-001", 0) == {"id": "inv-001", "version": {"$in": [0, None]}}
+    assert versioned_filter("inv-001", 4) == {"id": "inv-001", "version": 4}
+
+
+def test_legacy_document_without_version_counts_as_version_zero(fake_db):
+    response = Response()
+    batch = asyncio.run(server.update_inventory_batch(
+        "inv-001", InventoryBatchUpdate(quantity=90), response, if_match='"0"', current_user=None
+    ))
+    assert batch.quantity == 90
+    assert batch.version == 1
+    assert response.headers["ETag"] == '"1"'
+
+
+def test_update_inventory_with_stale_version_returns_412(fake_db):
+    asyncio.run(server.update_inventory_batch(
+        "inv-001", InventoryBatchUpdate(quantity=90), Response(), if_match=None, current_user=None
+    ))
+    assert status_of(server.update_inventory_batch(
+        "inv-001", InventoryBatchUpdate(quantity=80), Response(), if_match='"0"', current_user=None
+    )) == 412
+    assert fake_db.inventory_batches.docs[0]["quantity"] == 90
+
+
+def test_update_missing_inventory_returns_404(fake_db):
+    assert status_of(server.update_inventory_batch(
+        "missing", InventoryBatchUpdate(quantity=1), Response(), if_match='"0"', current_user=None
+    )) == 404
+
+
+@pytest.mark.parametrize("fields", [
+    {},
+    {"quantity": 1, "version": 7},
+    {"quantity": None},
+    {"expiration_date": "1/5/2027"},
+    {"received_date": "2026-1-5"},
+])
+def test_inventory_update_rejects_invalid_payloads(fields):
+    with pytest.raises(ValidationError):
+        InventoryBatchUpdate(**fields)
+
+
+def test_inventory_update_stores_iso_dates(fake_db):
+    batch = asyncio.run(server.update_inventory_batch(
+        "inv-001", InventoryBatchUpdate(expiration_date="2027-01-05"), Response(), if_match=None, current_user=None
+    ))
+    assert batch.expiration_date == "2027-01-05"
+    assert fake_db.inventory_batches.docs[0]["expiration_date"] == "2027-01-05"
+
+
+@pytest.fixture
+def api_client(fake_db):
+    server.app.dependency_overrides[server.get_current_user] = lambda: None
+    yield TestClient(server.app)
+    server.app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/api/inventory/inv-001", {}),
+    ("/api/inventory/inv-001", {"quantity": None}),
+    ("/api/requests/req-001", {}),
+    ("/api/requests/req-001", {"status": None}),
+])
+def test_empty_or_null_update_is_rejected_without_bumping_version(api_client, fake_db, path, body):
+    response = api_client.put(path, json=body)
+    assert response.status_code == 422
+    assert "version" not in fake_db.inventory_batches.docs[0]
+    assert "version" not in fake_db.food_requests.docs[0]
+
+
+def test_update_food_request_with_stale_version_returns_412(fake_db):
+    assert status_of(server.update_food_request(
+        "req-001", FoodRequestUpdate(status="completed"), Response(), if_match='"2"', current_user=None
+    )) == 412
+    assert fake_db.food_requests.docs[0]["status"] == "pending"
+
+
+def test_update_missing_food_request_returns_404(fake_db):
+    assert status_of(server.update_food_request(
+        "missing", FoodRequestUpdate(status="completed"), Response(), if_match=None, current_user=None
+    )) == 404
+
+
+@pytest.mark.parametrize("fields", [
+    {"items": [{"quantity": 2}]},
+    {"items": None},
+    {"pickup_date": "02/01/2026"},
+    {"status": "lost"},
+])
+def test_food_request_update_rejects_invalid_payloads(fields):
+    with pytest.raises(ValidationError):
+        FoodRequestUpdate(**fields)
+
+
+def test_adjust_inventory_applies_delta(fake_db):
+    response = Response()
+    batch = asyncio.run(server.adjust_inventory_batch(
+        "inv-001", InventoryAdjustment(delta=-30), response, current_user=None
+    ))
+    assert batch.quantity == 70
+    assert batch.version == 1
+    assert response.headers["ETag"] == '"1"'
+
+
+def test_adjust_inventory_below_zero_returns_409(fake_db):
+    assert status_of(server.adjust_inventory_batch(
+        "inv-001", InventoryAdjustment(delta=-101), Response(), current_user=None
+    )) == 409
+    assert fake_db.inventory_batches.docs[0]["quantity"] == 100
+
+
+def test_adjust_missing_inventory_returns_404(fake_db):
+    assert status_of(server.adjust_inventory_batch(
+        "missing", InventoryAdjustment(delta=5), Response(), current_user=None
+    )) == 404
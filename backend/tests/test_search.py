@@ -0,0 +1,112 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+import server
+from server import ItemNamePrefixIndex, date_range_filter
+from tests.fakes import FakeDb
+
+
+def make_index(*names):
+    index = ItemNamePrefixIndex()
+    index.rebuild(names)
+    return index
+
+
+def test_prefix_matches_whole_name_and_any_word():
+    index = make_index("Rice", "Rice Flour", "Brown Rice", "Canned Beans")
+    assert index.search("rice") == ["Rice", "Rice Flour", "Brown Rice"]
+    assert index.search("brow") == ["Brown Rice"]
+
+
+def test_prefix_is_case_insensitive_and_spans_words():
+    index = make_index("Rice (White)", "Rye Bread")
+    assert index.search("RICE (wh") == ["Rice (White)"]
+    assert index.search("r") == ["Rice (White)", "Rye Bread"]
+
+
+def test_search_respects_limit_and_ignores_blank_prefix():
+    index = make_index("Apples", "Apricots", "Dried Apples")
+    assert index.search("ap", limit=2) == ["Apples", "Apricots"]
+    assert index.search("  ") == []
+
+
+def test_add_and_discard_keep_index_current():
+    index = make_index("Rice")
+    index.add("Brown Rice")
+    assert index.search("rice") == ["Rice", "Brown Rice"]
+
+    index.discard("Brown Rice")
+    index.discard("Not Indexed")
+    assert index.search("rice") == ["Rice"]
+    assert index.search("brown") == []
+
+
+def test_name_is_counted_per_active_summary():
+    # Rice stocked at two locations: emptying one must not drop the name
+    index = make_index("Rice", "Rice")
+    index.discard("Rice")
+    assert index.search("rice") == ["Rice"]
+
+    index.add("Rice")
+    index.discard("Rice")
+    index.discard("Rice")
+    assert index.search("rice") == []
+
+
+def test_date_range_filter_uses_iso_dates():
+    assert date_range_filter(date(2024, 1, 5), date(2024, 12, 31)) == {"$gte": "2024-01-05", "$lte": "2024-12-31"}
+    assert date_range_filter(None, date(2024, 2, 1)) == {"$lte": "2024-02-01"}
+    assert date_range_filter(None, None) is None
+
+
+def make_request(request_id, created_at, *names, status="pending"):
+    return {
+        "id": request_id,
+        "confirmation_number": f"TS-{request_id[-6:]}",
+        "location_id": "LOC-001",
+        "items": [{"name": name, "quantity": 1} for name in names],
+        "pickup_date": "2026-02-01",
+        "pickup_time": "10:00",
+        "household_size": 3,
+        "status": status,
+        "created_at": created_at,
+    }
+
+
+@pytest.fixture
+def request_db(monkeypatch):
+    db = FakeDb(food_requests=[
+        make_request("req-100001", "2026-01-01T10:00:00+00:00", "Rice"),
+        make_request("req-100002", "2026-01-03T10:00:00+00:00", "Brown Rice", "Canned Beans"),
+        make_request("req-200003", "2026-01-02T10:00:00+00:00", "Canned Beans", status="completed"),
+    ])
+    monkeypatch.setattr(server, "db", db)
+    monkeypatch.setattr(server, "item_name_index", make_index("Rice", "Brown Rice", "Canned Beans"))
+    return db
+
+
+def search_requests(**params):
+    params = {"q": None, "status": None, "location_id": None, "date_from": None, "date_to": None, "limit": 100, **params}
+    return [req["id"] for req in asyncio.run(server.search_food_requests(current_user=None, **params))]
+
+
+@pytest.mark.parametrize("q, expected", [
+    ("ric", ["req-100002", "req-100001"]),
+    ("brow", ["req-100002"]),
+    ("bean", ["req-100002", "req-200003"]),
+    ("oats", []),
+])
+def test_request_search_matches_item_name_prefixes(request_db, q, expected):
+    assert search_requests(q=q) == expected
+
+
+def test_request_search_combines_prefix_with_filters(request_db):
+    assert search_requests(q="bean", status="completed") == ["req-200003"]
+    assert search_requests(q="rice", limit=1) == ["req-100002"]
+
+
+def test_request_search_by_confirmation_prefix(request_db):
+    assert search_requests(q="ts-2") == ["req-200003"]
+    assert search_requests(q="1000") == ["req-100002", "req-100001"]
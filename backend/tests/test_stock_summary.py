@@ -0,0 +1,186 @@
+import asyncio
+
+import pytest
+
+import server
+from server import ItemNamePrefixIndex, summary_key
+from tests.fakes import FakeDb
+
+
+def make_batch(batch_id, quantity, item_name="Rice", unit="lbs", storage_location="Warehouse A-2", expiration_date="2027-06-12"):
+    return {
+        "id": batch_id,
+        "item_name": item_name,
+        "category": "Dry",
+        "quantity": quantity,
+        "unit": unit,
+        "source": "USDA",
+        "received_date": "2026-01-12",
+        "expiration_date": expiration_date,
+        "storage_location": storage_location,
+        "created_at": "2026-01-12T10:00:00+00:00",
+    }
+
+
+RICE = summary_key(make_batch("key", 0))
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    db = FakeDb()
+    monkeypatch.setattr(server, "db", db)
+    monkeypatch.setattr(server, "item_name_index", ItemNamePrefixIndex())
+    return db
+
+
+def summary_for(db, key):
+    return next(doc for doc in db.inventory_summaries.docs if summary_key(doc) == key)
+
+
+def pause_first_summary_write(db):
+    """Hold the first refresh between its aggregate and its summary write until released."""
+    paused, release = asyncio.Event(), asyncio.Event()
+    find_one_and_update = db.inventory_summaries.find_one_and_update
+
+    async def gated_find_one_and_update(query, update, **kwargs):
+        # The sequence marker is an $inc; the summary write is the $set
+        if "$set" in update and not paused.is_set():
+            paused.set()
+            await release.wait()
+        return await find_one_and_update(query, update, **kwargs)
+
+    db.inventory_summaries.find_one_and_update = gated_find_one_and_update
+    return paused, release
+
+
+def test_refresh_totals_batches_and_tracks_nearest_expiration(fake_db):
+    fake_db.inventory_batches.docs += [
+        make_batch("b1", 30, expiration_date="2027-06-12"),
+        make_batch("b2", 45, expiration_date="2026-11-01"),
+    ]
+    asyncio.run(server.refresh_stock_summary(RICE))
+
+    summary = summary_for(fake_db, RICE)
+    assert summary["total_quantity"] == 75
+    assert summary["batch_count"] == 2
+    assert summary["nearest_expiration"] == "2026-11-01"
+    assert server.item_name_index.search("rice") == ["Rice"]
+
+
+def test_batches_in_different_units_get_separate_totals(fake_db):
+    fake_db.inventory_batches.docs += [make_batch("b1", 30, unit="lbs"), make_batch("b2", 4, unit="cases")]
+    asyncio.run(server.refresh_stock_summary(summary_key(fake_db.inventory_batches.docs[0])))
+    asyncio.run(server.refresh_stock_summary(summary_key(fake_db.inventory_batches.docs[1])))
+
+    totals = {doc["unit"]: doc["total_quantity"] for doc in fake_db.inventory_summaries.docs}
+    assert totals == {"lbs": 30, "cases": 4}
+
+
+def test_rebuild_groups_by_key_and_refreshes_name_index(fake_db):
+    fake_db.inventory_batches.docs += [
+        make_batch("b1", 30),
+        make_batch("b2", 20),
+        make_batch("b3", 4, unit="cases"),
+        make_batch("b4", 12, item_name="Canned Beans"),
+    ]
+    fake_db.inventory_summaries.docs.append({**RICE, "item_name": "Stale", "total_quantity": 1, "batch_count": 1})
+
+    asyncio.run(server.rebuild_stock_summaries())
+
+    totals = {(doc["item_name"], doc["unit"]): doc["total_quantity"] for doc in fake_db.inventory_summaries.docs}
+    assert totals == {("Rice", "lbs"): 50, ("Rice", "cases"): 4, ("Canned Beans", "lbs"): 12}
+    assert server.item_name_index.search("stale") == []
+    assert server.item_name_index.search("beans") == ["Canned Beans"]
+
+
+def test_summary_without_batches_is_hidden_from_reads(fake_db):
+    fake_db.inventory_batches.docs.append(make_batch("b1", 30))
+    asyncio.run(server.refresh_stock_summary(RICE))
+    fake_db.inventory_batches.docs.clear()
+    asyncio.run(server.refresh_stock_summary(RICE))
+
+    assert summary_for(fake_db, RICE)["batch_count"] == 0
+    assert asyncio.run(server.get_inventory_summary()) == []
+    assert asyncio.run(server.get_inventory_summary(low_stock=True)) == []
+    assert server.item_name_index.search("rice") == []
+
+
+def test_stale_refresh_finishing_last_is_discarded(fake_db):
+    fake_db.inventory_batches.docs.append(make_batch("b1", 30))
+
+    async def scenario():
+        paused, release = pause_first_summary_write(fake_db)
+        older = asyncio.create_task(server.refresh_stock_summary(RICE))
+        await paused.wait()
+
+        # A second write lands while the first refresh is holding its 30-lb aggregate
+        fake_db.inventory_batches.docs.append(make_batch("b2", 45))
+        await server.refresh_stock_summary(RICE)
+
+        release.set()
+        await older
+
+    asyncio.run(scenario())
+    summary = summary_for(fake_db, RICE)
+    assert summary["total_quantity"] == 75
+    assert summary["applied_seq"] == 2
+
+
+def test_newer_refresh_finishing_last_is_kept(fake_db):
+    fake_db.inventory_batches.docs.append(make_batch("b1", 30))
+    asyncio.run(server.refresh_stock_summary(RICE))
+    assert summary_for(fake_db, RICE)["total_quantity"] == 30
+
+    fake_db.inventory_batches.docs.append(make_batch("b2", 45))
+    asyncio.run(server.refresh_stock_summary(RICE))
+
+    summary = summary_for(fake_db, RICE)
+    assert summary["total_quantity"] == 75
+    assert summary["applied_seq"] == 2
+
+
+def test_dashboard_low_stock_uses_item_totals(fake_db):
+    fake_db.inventory_batches.docs += [
+        make_batch("b1", 30),
+        make_batch("b2", 30),
+        make_batch("b3", 40, item_name="Frozen Chicken", storage_location="Freezer D-1"),
+        make_batch("b4", 10, item_name="Milk", unit="gallons"),
+    ]
+    asyncio.run(server.rebuild_stock_summaries())
+    # Milk is gone entirely; its zero-count summary must not count as low stock
+    fake_db.inventory_batches.docs.pop()
+    asyncio.run(server.refresh_stock_summary(summary_key(make_batch("x", 0, item_name="Milk", unit="gallons"))))
+
+    stats = asyncio.run(server.get_dashboard_stats(current_user=None))
+
+    assert stats["low_stock_items"] == 1
+    messages = [alert["message"] for alert in fake_db.alerts.docs]
+    assert messages == ["Low stock: Frozen Chicken has only 40 lbs remaining at Freezer D-1"]
+
+
+@pytest.mark.parametrize("emptied_key_lands_last", [True, False])
+def test_name_stays_indexed_while_another_location_has_stock(fake_db, emptied_key_lands_last):
+    fake_db.inventory_batches.docs.append(make_batch("a1", 30, storage_location="Warehouse A-1"))
+    asyncio.run(server.rebuild_stock_summaries())
+    location_a = summary_key(fake_db.inventory_batches.docs[0])
+
+    # The last Rice batch at A is deleted while a Rice batch is created at B
+    fake_db.inventory_batches.docs.clear()
+    fake_db.inventory_batches.docs.append(make_batch("b1", 20, storage_location="Warehouse B-1"))
+    location_b = summary_key(fake_db.inventory_batches.docs[0])
+
+    async def scenario():
+        if not emptied_key_lands_last:
+            await server.refresh_stock_summary(location_a)
+            await server.refresh_stock_summary(location_b)
+            return
+        paused, release = pause_first_summary_write(fake_db)
+        emptied = asyncio.create_task(server.refresh_stock_summary(location_a))
+        await paused.wait()
+        await server.refresh_stock_summary(location_b)
+        release.set()
+        await emptied
+
+    asyncio.run(scenario())
+    assert server.item_name_index.search("rice") == ["Rice"]
+    assert summary_for(fake_db, location_a)["batch_count"] == 0
@@ -5,20 +5,28 @@ import { api } from '@/utils/api';
 import { Card } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
 import { Button } from '@/components/ui/button';
+import { Input } from '@/components/ui/input';
+import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select';
 import { toast } from 'sonner';
 import { CheckCircle, Clock, XCircle } from 'lucide-react';
 
 const ClientRequests = () => {
   const [requests, setRequests] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [search, setSearch] = useState('');
+  const [statusFilter, setStatusFilter] = useState('all');
 
   useEffect(() => {
-    fetchRequests();
-  }, []);
+    const timer = setTimeout(fetchRequests, 250);
+    return () => clearTimeout(timer);
+  }, [search, statusFilter]);
 
   const fetchRequests = async () => {
+    const params = { limit: 200 };
+    if (search.trim()) params.q = search.trim();
+    if (statusFilter !== 'all') params.status = statusFilter;
     try {
-      const response = await api.getFoodRequests();
+      const response = await api.searchFoodRequests(params);
       setRequests(response.data);
     } catch (error) {
       toast.error('Failed to load requests');
@@ -27,13 +35,18 @@ const ClientRequests = () => {
     }
   };
 
-  const updateStatus = async (id, status) => {
+  const updateStatus = async (request, status) => {
     try {
-      await api.updateFoodRequest(id, { status });
+      await api.updateFoodRequest(request.id, { status }, request.version);
       toast.success(`Request marked as ${status}`);
       fetchRequests();
     } catch (error) {
-      toast.error('Failed to update request');
+      if (error.response?.status === 412) {
+        toast.error('This request was modified by someone else. Reloading the latest version.');
+        fetchRequests();
+      } else {
+        toast.error('Failed to update request');
+      }
     }
   };
 
@@ -69,13 +82,36 @@ const ClientRequests = () => {
             </p>
           </div>
 
+          <div className="flex gap-4 mb-6">
+            <Input
+              value={search}
+              onChange={(e) => setSearch(e.target.value)}
+              placeholder="Search by item or confirmation number..."
+              className="max-w-sm bg-white"
+              data-testid="request-search-input"
+            />
+            <Select value={statusFilter} onValueChange={setStatusFilter}>
+              <SelectTrigger className="w-48 bg-white" data-testid="request-status-filter">
+                <SelectValue placeholder="All statuses" />
+              </SelectTrigger>
+              <SelectContent>
+                <SelectItem value="all">All statuses</SelectItem>
+                <SelectItem value="pending">Pending</SelectItem>
+                <SelectItem value="completed">Completed</SelectItem>
+                <SelectItem value="cancelled">Cancelled</SelectItem>
+              </SelectContent>
+            </Select>
+          </div>
+
           {loading ? (
             <div className="text-center py-12">
               <p className="text-gray-500">Loading requests...</p>
             </div>
           ) : requests.length === 0 ? (
             <div className="bg-white rounded-lg border border-[#E2E8F0] p-12 text-center">
-              <p className="text-gray-500" style={{ fontFamily: 'Inter, sans-serif' }}>No client requests yet</p>
+              <p className="text-gray-500" style={{ fontFamily: 'Inter, sans-serif' }}>
+                {search || statusFilter !== 'all' ? 'No requests match your search' : 'No client requests yet'}
+              </p>
             </div>
           ) : (
             <div className="grid grid-cols-1 gap-4" data-testid="client-requests-list">
@@ -131,7 +167,7 @@ const ClientRequests = () => {
                     {request.status === 'pending' && (
                       <div className="flex gap-2">
                         <Button
-                          onClick={() => updateStatus(request.id, 'completed')}
+                          onClick={() => updateStatus(request, 'completed')}
                           data-testid={`complete-request-${request.id}`}
                           size="sm"
                           className="bg-green-600 hover:bg-green-700 text-white"
@@ -139,7 +175,7 @@ const ClientRequests = () => {
                           Complete
                         </Button>
                         <Button
-                          onClick={() => updateStatus(request.id, 'cancelled')}
+                          onClick={() => updateStatus(request, 'cancelled')}
                           data-testid={`cancel-request-${request.id}`}
                           size="sm"
                           variant="outline"
@@ -12,6 +12,10 @@ import { Plus, Edit, Trash2 } from 'lucide-react';
 
 const Inventory = () => {
   const [inventory, setInventory] = useState([]);
+  const [summary, setSummary] = useState([]);
+  const [search, setSearch] = useState('');
+  const [categoryFilter, setCategoryFilter] = useState('all');
+  const [suggestions, setSuggestions] = useState([]);
   const [loading, setLoading] = useState(true);
   const [showDialog, setShowDialog] = useState(false);
   const [formData, setFormData] = useState({
@@ -26,13 +30,21 @@ const Inventory = () => {
   });
 
   useEffect(() => {
-    fetchInventory();
-  }, []);
+    const timer = setTimeout(fetchInventory, 250);
+    return () => clearTimeout(timer);
+  }, [search, categoryFilter]);
 
   const fetchInventory = async () => {
+    const params = { limit: 200 };
+    if (search.trim()) params.q = search.trim();
+    if (categoryFilter !== 'all') params.category = categoryFilter;
     try {
-      const response = await api.getInventory();
-      setInventory(response.data);
+      const [batchesResponse, summaryResponse] = await Promise.all([
+        api.searchInventory(params),
+        api.getInventorySummary()
+      ]);
+      setInventory(batchesResponse.data);
+      setSummary(summaryResponse.data);
     } catch (error) {
       toast.error('Failed to load inventory');
     } finally {
@@ -65,6 +77,20 @@ const Inventory = () => {
     }
   };
 
+  const handleSearchChange = async (value) => {
+    setSearch(value);
+    if (!value.trim()) {
+      setSuggestions([]);
+      return;
+    }
+    try {
+      const response = await api.getInventoryTypeahead(value.trim());
+      setSuggestions(response.data);
+    } catch (error) {
+      setSuggestions([]);
+    }
+  };
+
   const handleDelete = async (id) => {
     if (!window.confirm('Delete this batch?')) return;
     try {
@@ -76,6 +102,7 @@ const Inventory = () => {
     }
   };
 
+  const LOW_STOCK_THRESHOLD = 50;
   const categories = ['Dry', 'Dairy', 'Canned', 'Frozen', 'Fresh'];
   const sources = ['Donation', 'USDA', 'Second Harvest Heartland'];
 
@@ -207,57 +234,121 @@ const Inventory = () => {
             </Dialog>
           </div>
 
+          <div className="flex gap-4 mb-6">
+            <Input
+              value={search}
+              onChange={(e) => handleSearchChange(e.target.value)}
+              placeholder="Search items..."
+              list="inventory-suggestions"
+              className="max-w-sm bg-white"
+              data-testid="inventory-search-input"
+            />
+            <datalist id="inventory-suggestions">
+              {suggestions.map(name => (
+                <option key={name} value={name} />
+              ))}
+            </datalist>
+            <Select value={categoryFilter} onValueChange={setCategoryFilter}>
+              <SelectTrigger className="w-48 bg-white" data-testid="inventory-category-filter">
+                <SelectValue placeholder="All categories" />
+              </SelectTrigger>
+              <SelectContent>
+                <SelectItem value="all">All categories</SelectItem>
+                {categories.map(cat => (
+                  <SelectItem key={cat} value={cat}>{cat}</SelectItem>
+                ))}
+              </SelectContent>
+            </Select>
+          </div>
+
           {loading ? (
             <div className="text-center py-12">
               <p className="text-gray-500">Loading inventory...</p>
             </div>
           ) : (
-            <div className="bg-white rounded-lg border border-[#E2E8F0] overflow-hidden">
-              <table className="w-full" data-testid="inventory-table">
-                <thead className="bg-gray-50 border-b border-[#E2E8F0]">
-                  <tr>
-                    <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Item</th>
-                    <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Category</th>
-                    <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Quantity</th>
-                    <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Source</th>
-                    <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Expiration</th>
-                    <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Location</th>
-                    <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Actions</th>
-                  </tr>
-                </thead>
-                <tbody className="divide-y divide-[#E2E8F0]">
-                  {inventory.length === 0 ? (
+            <>
+              {summary.length > 0 && (
+                <div className="bg-white rounded-lg border border-[#E2E8F0] overflow-hidden mb-6">
+                  <div className="px-6 py-4 border-b border-[#E2E8F0]">
+                    <h2 className="text-lg font-bold text-[#0F172A]" style={{ fontFamily: 'Manrope, sans-serif' }}>Stock by Item</h2>
+                  </div>
+                  <table className="w-full" data-testid="inventory-summary-table">
+                    <thead className="bg-gray-50 border-b border-[#E2E8F0]">
+                      <tr>
+                        <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Item</th>
+                        <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Category</th>
+                        <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Total</th>
+                        <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Batches</th>
+                        <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Nearest Expiration</th>
+                        <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Location</th>
+                      </tr>
+                    </thead>
+                    <tbody className="divide-y divide-[#E2E8F0]">
+                      {summary.map((item) => (
+                        <tr key={`${item.item_name}|${item.category}|${item.storage_location}|${item.unit}`} className="hover:bg-gray-50">
+                          <td className="px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900" style={{ fontFamily: 'Inter, sans-serif' }}>{item.item_name}</td>
+                          <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-600">
+                            <span className="px-2 py-1 bg-blue-50 text-blue-700 rounded text-xs font-medium">{item.category}</span>
+                          </td>
+                          <td className={`px-6 py-4 whitespace-nowrap text-sm ${item.total_quantity < LOW_STOCK_THRESHOLD ? 'text-red-600 font-medium' : 'text-gray-600'}`} style={{ fontFamily: 'JetBrains Mono, monospace' }}>{item.total_quantity} {item.unit}</td>
+                          <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-600">{item.batch_count}</td>
+                          <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-600">{item.nearest_expiration}</td>
+                          <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-600">{item.storage_location}</td>
+                        </tr>
+                      ))}
+                    </tbody>
+                  </table>
+                </div>
+              )}
+              <div className="bg-white rounded-lg border border-[#E2E8F0] overflow-hidden">
+                <table className="w-full" data-testid="inventory-table">
+                  <thead className="bg-gray-50 border-b border-[#E2E8F0]">
                     <tr>
-                      <td colSpan="7" className="px-6 py-12 text-center text-gray-500">
-                        No inventory items yet. Add your first batch to get started.
-                      </td>
+                      <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Item</th>
+                      <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Category</th>
+                      <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Quantity</th>
+                      <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Source</th>
+                      <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Expiration</th>
+                      <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Location</th>
+                      <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider" style={{ fontFamily: 'Inter, sans-serif' }}>Actions</th>
                     </tr>
-                  ) : (
-                    inventory.map((item) => (
-                      <tr key={item.id} className="hover:bg-gray-50">
-                        <td className="px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900" style={{ fontFamily: 'Inter, sans-serif' }}>{item.item_name}</td>
-                        <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-600">
-                          <span className="px-2 py-1 bg-blue-50 text-blue-700 rounded text-xs font-medium">{item.category}</span>
-                        </td>
-                        <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-600" style={{ fontFamily: 'JetBrains Mono, monospace' }}>{item.quantity} {item.unit}</td>
-                        <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-600">{item.source}</td>
-                        <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-600">{item.expiration_date}</td>
-                        <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-600">{item.storage_location}</td>
-                        <td className="px-6 py-4 whitespace-nowrap text-sm">
-                          <button
-                            onClick={() => handleDelete(item.id)}
-                            data-testid={`delete-inventory-${item.id}`}
-                            className="text-red-600 hover:text-red-900"
-                          >
-                            <Trash2 className="w-4 h-4" />
-                          </button>
+                  </thead>
+                  <tbody className="divide-y divide-[#E2E8F0]">
+                    {inventory.length === 0 ? (
+                      <tr>
+                        <td colSpan="7" className="px-6 py-12 text-center text-gray-500">
+                          {search || categoryFilter !== 'all'
+                          ? 'No batches match your search.'
+                          : 'No inventory items yet. Add your first batch to get started.'}
                         </td>
                       </tr>
-                    ))
-                  )}
-                </tbody>
-              </table>
-            </div>
+                    ) : (
+                      inventory.map((item) => (
+                        <tr key={item.id} className="hover:bg-gray-50">
+                          <td className="px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900" style={{ fontFamily: 'Inter, sans-serif' }}>{item.item_name}</td>
+                          <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-600">
+                            <span className="px-2 py-1 bg-blue-50 text-blue-700 rounded text-xs font-medium">{item.category}</span>
+                          </td>
+                          <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-600" style={{ fontFamily: 'JetBrains Mono, monospace' }}>{item.quantity} {item.unit}</td>
+                          <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-600">{item.source}</td>
+                          <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-600">{item.expiration_date}</td>
+                          <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-600">{item.storage_location}</td>
+                          <td className="px-6 py-4 whitespace-nowrap text-sm">
+                            <button
+                              onClick={() => handleDelete(item.id)}
+                              data-testid={`delete-inventory-${item.id}`}
+                              className="text-red-600 hover:text-red-900"
+                            >
+                              <Trash2 className="w-4 h-4" />
+                            </button>
+                          </td>
+                        </tr>
+                      ))
+                    )}
+                  </tbody>
+                </table>
+              </div>
+            </>
           )}
         </main>
       </div>
@@ -5,8 +5,12 @@ const API = `${process.env.REACT_APP_BACKEND_URL}/api`;
 export const api = {
   // Inventory
   getInventory: () => axios.get(`${API}/inventory`),
+  getInventorySummary: (params) => axios.get(`${API}/inventory/summary`, { params }),
+  searchInventory: (params) => axios.get(`${API}/inventory/search`, { params }),
+  getInventoryTypeahead: (q) => axios.get(`${API}/inventory/typeahead`, { params: { q } }),
   createInventory: (data) => axios.post(`${API}/inventory`, data),
-  updateInventory: (id, data) => axios.put(`${API}/inventory/${id}`, data),
+  updateInventory: (id, data, version) => axios.put(`${API}/inventory/${id}`, data, version === undefined ? undefined : { headers: { 'If-Match': `"${version}"` } }),
+  adjustInventory: (id, delta) => axios.post(`${API}/inventory/${id}/adjust`, { delta }),
   deleteInventory: (id) => axios.delete(`${API}/inventory/${id}`),
 
   // Distributions
@@ -15,8 +19,9 @@ export const api = {
 
   // Food Requests
   getFoodRequests: () => axios.get(`${API}/requests`),
+  searchFoodRequests: (params) => axios.get(`${API}/requests/search`, { params }),
   createFoodRequest: (data) => axios.post(`${API}/requests`, data),
-  updateFoodRequest: (id, data) => axios.put(`${API}/requests/${id}`, data),
+  updateFoodRequest: (id, data, version) => axios.put(`${API}/requests/${id}`, data, version === undefined ? undefined : { headers: { 'If-Match': `"${version}"` } }),
 
   // Alerts
   getAlerts: () => axios.get(`${API}/alerts`),